@@ -5,14 +5,28 @@ AxoDen Client - Bridge between AxoDen's AI guidance system and Claude Code
 __version__ = "0.1.0"
 __author__ = "Luminescence Limited"
 
-from .client import AxoDenClient
-from .config import AxoDenConfig
 from .exceptions import AxoDenError, AuthenticationError, MethodologyNotFoundError
 
 __all__ = [
     "AxoDenClient",
+    "AsyncAxoDenClient",
     "AxoDenConfig", 
     "AxoDenError",
     "AuthenticationError",
     "MethodologyNotFoundError",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Import the client and config lazily so that loading the CLI (or just the
+    # exceptions) does not pull in requests and keyring up front
+    if name == "AxoDenClient":
+        from .client import AxoDenClient
+        return AxoDenClient
+    if name == "AsyncAxoDenClient":
+        from .client import AsyncAxoDenClient
+        return AsyncAxoDenClient
+    if name == "AxoDenConfig":
+        from .config import AxoDenConfig
+        return AxoDenConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
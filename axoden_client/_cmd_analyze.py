@@ -0,0 +1,54 @@
+"""
+AxoDen CLI - `analyze` command: Analyze the current project
+"""
+
+import os
+import sys
+import click
+
+from .cli import _TTY, _get_console, _client
+from .exceptions import AxoDenError
+
+
+_STATUS_ANALYZING = "[bold green]Analyzing project structure..."
+
+
+@click.command()
+@click.option("--path", "-p", default=".", help="Project path to analyze")
+def analyze(path: str):
+    """Analyze current project and get methodology recommendations"""
+    console = _get_console()
+    try:
+        client = _client()
+        
+        if not _TTY:
+            # Tab-separated for pipes
+            analysis = client.analyze_project(path)
+            lines = [f"{key}\t{value}" for key, value in analysis["project_context"].items()]
+            lines.extend(f"methodology\t{method}" for method in analysis["recommended_methodologies"])
+            lines.append(f"confidence\t{analysis['confidence']}")
+            click.echo("\n".join(lines))
+            return
+        
+        display_path = os.getcwd() if path == "." else os.path.abspath(path)
+        console.print(f"[bold]Analyzing project at: {display_path}[/bold]\n")
+        
+        with console.status(_STATUS_ANALYZING):
+            analysis = client.analyze_project(path)
+        
+        # Display project context
+        rows = [(key.replace("_", " ").title(), value) for key, value in analysis["project_context"].items()]
+        width = max((len(label) for label, _ in rows), default=0)
+        lines = ["[bold]Project Context:[/bold]"]
+        lines.extend(f"  [cyan]{label:<{width}}[/cyan]  [green]{value}[/green]" for label, value in rows)
+        
+        # Display recommendations
+        lines.append("\n[bold]Recommended Methodologies:[/bold]")
+        lines.extend(f"  • {method}" for method in analysis["recommended_methodologies"])
+        lines.append(f"\n[dim]Confidence: {analysis['confidence']:.0%}[/dim]")
+        
+        console.print("\n".join(lines))
+        
+    except AxoDenError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,119 @@
+"""
+AxoDen CLI - `config` command: Configure client settings
+"""
+
+import os
+import time
+import click
+from typing import Optional, Dict, Any, Tuple
+from pathlib import Path
+
+from ._json import loads as _loads, dumps as _dumps
+from .cli import _get_console, _config, _client, _validate_api_key
+
+
+_API_KEY_MASK = "*" * 20
+_STATUS_CONNECTING = "[bold green]Connecting to AxoDen API..."
+
+# Successful health checks are reused for a short while so scripted
+# `config --test` loops don't hit the API every time
+_HEALTH_CACHE_FILE = Path.home() / ".cache" / "axoden" / "health.json"
+_HEALTH_TTL = 30
+
+
+def _cached_health(client, ttl: float = _HEALTH_TTL) -> Tuple[int, Dict[str, Any]]:
+    """Return (status code, body) of the health endpoint, cached for `ttl` seconds"""
+    now = time.time()
+    try:
+        cached = _loads(_HEALTH_CACHE_FILE.read_bytes())
+        if cached["base_url"] == client.base_url and now - cached["timestamp"] < ttl:
+            return cached["status"], cached["body"]
+    except Exception:
+        pass
+    
+    response = client.session.get(f"{client.base_url}/health")
+    if response.status_code != 200:
+        return response.status_code, {}
+    
+    body = response.json()
+    try:
+        _HEALTH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = _HEALTH_CACHE_FILE.with_suffix(".tmp")
+        tmp_file.write_bytes(_dumps({
+            "base_url": client.base_url,
+            "timestamp": now,
+            "status": response.status_code,
+            "body": body
+        }))
+        os.replace(tmp_file, _HEALTH_CACHE_FILE)
+    except OSError:
+        pass
+    
+    return response.status_code, body
+
+
+@click.command()
+@click.option("--api-key", help="Set AxoDen API key (or use AXODEN_API_KEY env var)")
+@click.option("--base-url", help="Set API base URL")
+@click.option("--show", is_flag=True, help="Show current configuration")
+@click.option("--test", is_flag=True, help="Test API connection")
+def config(api_key: Optional[str], base_url: Optional[str], show: bool, test: bool):
+    """Configure AxoDen client settings"""
+    console = _get_console()
+    config = _config()
+    
+    if show:
+        # Show current configuration
+        from rich.table import Table
+        
+        config_table = Table(title="AxoDen Configuration", show_header=True)
+        config_table.add_column("Setting", style="cyan")
+        config_table.add_column("Value", style="green")
+        
+        config_table.add_row("API Key", f"{_API_KEY_MASK}...{config.api_key[-4:]}" if config.api_key else "Not set")
+        config_table.add_row("Base URL", config.base_url)
+        config_table.add_row("Agent ID", config.agent_id or "Auto-generated")
+        config_table.add_row("Config File", str(config.config_file))
+        
+        console.print(config_table)
+        return
+    
+    if api_key:
+        error = _validate_api_key(api_key)
+        if error:
+            # If API key looks like it might be a file path or env var reference
+            if api_key.startswith(("$", "~")) or "/" in api_key:
+                console.print("[yellow]⚠️  This looks like a file path or env var. Use the actual API key value.[/yellow]")
+                console.print("[yellow]If you meant to use an environment variable, just set it:[/yellow]")
+                console.print("[bold]export AXODEN_API_KEY='your_actual_key'[/bold]")
+            else:
+                console.print(f"[red]❌ {error} Please check and try again.[/red]")
+            return
+            
+        config.save_api_key(api_key)
+        _client.cache_clear()
+        console.print(f"[green]✅ API key saved securely ({len(api_key)} characters)[/green]")
+    
+    if base_url:
+        config.base_url = base_url
+        config.save()
+        _client.cache_clear()
+        console.print(f"[green]✅ Base URL updated to: {base_url}[/green]")
+    
+    if test:
+        # Test API connection
+        console.print("\n[bold]Testing API connection...[/bold]")
+        try:
+            client = _client()
+            # Test with simple API call - skip the cache if settings just changed
+            with console.status(_STATUS_CONNECTING):
+                status_code, health_data = _cached_health(client, ttl=0 if api_key or base_url else _HEALTH_TTL)
+                
+            if status_code == 200:
+                console.print("[green]✅ API connection successful![/green]")
+                console.print(f"[dim]Status: {health_data.get('status', 'Unknown')}[/dim]")
+            else:
+                console.print(f"[red]❌ API connection failed (HTTP {status_code})[/red]")
+                
+        except Exception as e:
+            console.print(f"[red]❌ Connection error: {e}[/red]")
@@ -0,0 +1,42 @@
+"""
+AxoDen CLI - `list` command: List available methodologies
+"""
+
+import sys
+import click
+from typing import Optional
+
+from .cli import _TTY, _get_console, _client
+from .exceptions import AxoDenError
+
+
+_STATUS_FETCHING = "[bold green]Fetching methodologies..."
+
+
+@click.command()
+@click.option("--domain", "-d", help="Filter by domain")
+def list(domain: Optional[str]):
+    """List available methodologies"""
+    console = _get_console()
+    try:
+        client = _client()
+        
+        with console.status(_STATUS_FETCHING):
+            methodologies = client.list_methodologies(domain)
+        
+        if not _TTY:
+            # Tab-separated for pipes
+            click.echo("\n".join(f"{method['name']}\t{method['domain']}" for method in methodologies))
+            return
+        
+        # Display as plain lines rather than a full Table
+        lines = [f"[bold]Available Methodologies{f' ({domain})' if domain else ''}:[/bold]"]
+        width = max((len(method["name"]) for method in methodologies), default=0)
+        for method in methodologies:
+            lines.append(f"  [cyan]{method['name']:<{width}}[/cyan]  [green]{method['domain']}[/green]")
+        
+        console.print("\n".join(lines))
+        
+    except AxoDenError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,84 @@
+"""
+AxoDen CLI - `quickstart` command: Interactive quickstart guide
+"""
+
+import click
+
+from .cli import _get_console, _config, _client, _read_clipboard, _validate_api_key
+
+
+_QUICKSTART_CHOICES = click.Choice(('1', '2', '3'))
+
+
+@click.command()
+def quickstart():
+    """Interactive quickstart guide for new users"""
+    from rich.panel import Panel
+    
+    console = _get_console()
+    console.print(Panel(
+        "[bold blue]Welcome to AxoDen Client![/bold blue]\n\n"
+        "Let's get you set up to use AI-powered methodology recommendations "
+        "with Claude Code.",
+        border_style="blue"
+    ))
+    
+    # Check if API key is set
+    config = _config()
+    if not config.api_key:
+        console.print(
+            "\n[yellow]First, you'll need an AxoDen API key.[/yellow]\n"
+            "Visit [link]https://axoden.com/beta[/link] to request access.\n\n"
+            "[bold]Choose how to enter your API key:[/bold]\n"
+            "1. Type it in (hidden)\n"
+            "2. Paste from clipboard\n"
+            "3. Set environment variable (recommended)"
+        )
+        
+        choice = click.prompt("\nSelect option (1-3)", type=_QUICKSTART_CHOICES)
+        
+        if choice == '1':
+            api_key = click.prompt("Enter your API key", hide_input=True)
+        elif choice == '2':
+            console.print("\n[cyan]Copy your API key to clipboard, then press Enter...[/cyan]")
+            click.pause()
+            try:
+                api_key = _read_clipboard()
+                console.print(f"[green]✅ Got API key from clipboard ({len(api_key)} characters)[/green]")
+            except Exception:
+                console.print("[red]❌ Could not read from clipboard. Please use option 1 or 3.[/red]")
+                api_key = click.prompt("Enter your API key", hide_input=True)
+        else:  # choice == '3'
+            console.print(
+                "\n[cyan]Add this to your shell profile (~/.bashrc, ~/.zshrc, etc.):[/cyan]\n"
+                "[bold]export AXODEN_API_KEY='your_api_key_here'[/bold]\n"
+                "\nThen restart your terminal or run: [bold]source ~/.zshrc[/bold]\n"
+                "\n[yellow]After setting the environment variable, run 'axoden quickstart' again.[/yellow]"
+            )
+            return
+        
+        if api_key and _validate_api_key(api_key) is None:
+            config.save_api_key(api_key)
+            _client.cache_clear()
+            console.print("[green]✅ API key saved![/green]\n")
+        else:
+            console.print("[red]❌ Invalid API key. Please try again.[/red]")
+            return
+    
+    # Show example usage and next steps in a single render
+    examples = [
+        ("Debug a problem", "axoden recommend \"fix memory leak in production API\""),
+        ("Analyze project", "axoden analyze"),
+        ("Get specific methodology", "axoden recommend \"optimize database queries\" --format json"),
+    ]
+    
+    example_lines = "".join(f"[cyan]{title}:[/cyan]\n  $ {command}\n\n" for title, command in examples)
+    console.print(
+        f"[bold]Example Usage:[/bold]\n\n"
+        f"{example_lines}"
+        f"[bold]Next Steps:[/bold]\n"
+        f"1. Try the examples above\n"
+        f"2. Use recommendations in your Claude Code sessions\n"
+        f"3. Provide feedback to improve the system\n\n"
+        f"[dim]For more help: axoden --help[/dim]"
+    )
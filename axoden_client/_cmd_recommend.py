@@ -0,0 +1,93 @@
+"""
+AxoDen CLI - `recommend` command: Get a methodology recommendation for a problem
+"""
+
+import sys
+import click
+from typing import Optional
+from pathlib import Path
+
+from ._json import loads as _loads, dumps as _dumps
+from .cli import _TTY, _get_console, _client, _write_stdout
+from .exceptions import AxoDenError, AuthenticationError
+
+
+_STATUS_CONSULTING = "[bold green]Consulting AxoDen's knowledge base..."
+
+
+@click.command()
+@click.argument("problem", required=True)
+@click.option("--context", "-c", help="Project context as JSON")
+@click.option("--format", "-f", type=click.Choice(["claude", "json"]), default="claude",
+              help="Output format (claude for Claude Code, json for raw)")
+@click.option("--save", "-s", is_flag=True, help="Save recommendation to file")
+def recommend(problem: str, context: Optional[str], format: str, save: bool):
+    """Get methodology recommendation for a specific problem
+    
+    PROBLEM: Description of your development challenge
+    
+    Examples:
+        axoden recommend "optimize database queries"
+        axoden recommend "fix flaky tests" --context '{"language": "python"}'
+    """
+    console = _get_console()
+    try:
+        client = _client()
+        
+        # Parse context if provided
+        project_context = None
+        if context:
+            try:
+                project_context = _loads(context)
+            except ValueError:
+                console.print("[red]Error: Invalid JSON in context parameter[/red]")
+                sys.exit(1)
+        
+        # Show loading indicator
+        with console.status(_STATUS_CONSULTING):
+            recommendation = client.recommend(problem, project_context, format)
+        
+        # Same timestamp for either save format; formatted without strftime's locale path
+        t = recommendation.timestamp
+        stamp = f"{t.year:04d}{t.month:02d}{t.day:02d}_{t.hour:02d}{t.minute:02d}{t.second:02d}"
+        
+        # Display recommendation
+        if format == "claude":
+            formatted = recommendation.format_for_claude_code()
+            
+            if save and not _TTY:
+                # Piped output - the raw markdown is all that's needed
+                sys.stdout.write(formatted + "\n")
+            else:
+                # Rich formatted output for Claude Code
+                from rich.panel import Panel
+                from rich.markdown import Markdown
+                
+                console.print(Panel(
+                    Markdown(formatted),
+                    title=f"[bold blue]AxoDen Methodology Recommendation[/bold blue]",
+                    border_style="blue"
+                ))
+            
+            if save:
+                filename = f"axoden_recommendation_{stamp}.md"
+                Path(filename).write_bytes(formatted.encode("utf-8"))
+                console.print(f"\n[green]✅ Saved to {filename}[/green]")
+                
+        else:
+            # JSON output - raw bytes straight to stdout, no Rich markup pass
+            data = _dumps(recommendation.to_json(), pretty=True)
+            _write_stdout(data)
+            
+            if save:
+                filename = f"axoden_recommendation_{stamp}.json"
+                Path(filename).write_bytes(data)
+                console.print(f"\n[green]✅ Saved to {filename}[/green]")
+                
+    except AuthenticationError as e:
+        console.print(f"[red]Authentication Error: {e}[/red]")
+        click.echo("\nRun 'axoden config --api-key YOUR_KEY' to set up authentication")
+        sys.exit(1)
+    except AxoDenError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
@@ -0,0 +1,87 @@
+"""
+AxoDen CLI - `setup-key` command: Interactive API key setup
+"""
+
+import click
+
+from .cli import _get_console, _config, _client, _read_clipboard, _validate_api_key
+
+
+_SETUP_CHOICES = click.Choice(('1', '2', '3', '4'))
+
+
+@click.command()
+def setup_key():
+    """Easy API key setup with multiple input options"""
+    from rich.panel import Panel
+    
+    console = _get_console()
+    console.print(Panel(
+        "[bold blue]AxoDen API Key Setup[/bold blue]\n\n"
+        "Choose the best way to enter your API key:",
+        border_style="blue"
+    ))
+    
+    config = _config()
+    
+    console.print(
+        "\n[bold]Choose input method:[/bold]\n"
+        "1. 📋 Paste from clipboard (recommended)\n"
+        "2. ⌨️  Type manually (hidden)\n"
+        "3. 🔧 Set environment variable\n"
+        "4. 📄 Show current status"
+    )
+    
+    choice = click.prompt("\nSelect option (1-4)", type=_SETUP_CHOICES)
+    
+    if choice == '1':
+        console.print("\n[cyan]📋 Copy your API key to clipboard first, then press Enter...[/cyan]")
+        click.pause()
+        try:
+            api_key = _read_clipboard()
+            
+            error = _validate_api_key(api_key)
+            if error:
+                console.print(f"[red]❌ Clipboard content doesn't look like an API key: {error}[/red]")
+                return
+                
+            console.print(f"[green]✅ Got API key from clipboard ({len(api_key)} characters)[/green]")
+            config.save_api_key(api_key)
+            _client.cache_clear()
+            console.print("[green]🔐 API key saved securely![/green]")
+            
+        except Exception as e:
+            console.print(f"[red]❌ Could not read from clipboard: {e}[/red]")
+            console.print("[yellow]💡 Try option 2 (manual entry) or 3 (environment variable)[/yellow]")
+            
+    elif choice == '2':
+        console.print("\n[yellow]⚠️  Characters will be hidden for security[/yellow]")
+        api_key = click.prompt("Enter your API key", hide_input=True)
+        error = _validate_api_key(api_key)
+        if error:
+            console.print(f"[red]❌ {error}[/red]")
+            return
+        config.save_api_key(api_key)
+        _client.cache_clear()
+        console.print(f"[green]✅ API key saved ({len(api_key)} characters)[/green]")
+        
+    elif choice == '3':
+        console.print(
+            "\n[cyan]🔧 Environment Variable Setup:[/cyan]\n"
+            "Add this line to your shell profile:\n"
+            "[bold green]export AXODEN_API_KEY='your_api_key_here'[/bold green]\n"
+            "\n📁 Shell profile locations:\n"
+            "• macOS/Linux: ~/.bashrc or ~/.zshrc\n"
+            "• Windows: Use System Environment Variables\n"
+            "\n🔄 After adding it, restart your terminal or run:\n"
+            "[bold]source ~/.zshrc[/bold]\n"
+            "\n✨ Then run: [bold]axoden config --test[/bold]"
+        )
+        
+    else:  # choice == '4'
+        if config.api_key:
+            console.print(f"[green]✅ API key is configured ({len(config.api_key)} characters)[/green]")
+            click.echo(f"🔧 Base URL: {config.base_url}")
+        else:
+            console.print("[red]❌ No API key configured[/red]")
+            click.echo("Run this command again and choose option 1, 2, or 3")
@@ -0,0 +1,34 @@
+"""
+AxoDen Client - JSON helpers (orjson when installed, stdlib otherwise)
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        # orjson reads str and bytes natively - encoding a str first would only add a copy
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes"""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if pretty else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    # Match orjson byte for byte: raw UTF-8 and no spaces in compact output
+    return json.dumps(
+        obj,
+        indent=2 if pretty else None,
+        separators=(",", ": ") if pretty else (",", ":"),
+        sort_keys=sort_keys,
+        ensure_ascii=False
+    ).encode("utf-8")
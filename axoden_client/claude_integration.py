@@ -4,7 +4,6 @@ AxoDen Claude Code Integration - AI-powered development workflow helper
 
 import os
 import sys
-import subprocess
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -41,6 +40,7 @@ Please help me implement this solution following the above approach."""
     def save_to_clipboard(self, text: str):
         """Save text to system clipboard for easy pasting into Claude Code"""
         try:
+            import subprocess
             if sys.platform == "darwin":  # macOS
                 subprocess.run(["pbcopy"], input=text.encode(), check=True)
             elif sys.platform == "linux":
@@ -3,31 +3,181 @@ AxoDen Client - Core API client for AI-powered development guidance
 """
 
 import os
-import json
-import requests
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import copy
+import hashlib
+import importlib.util
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 import uuid
 
+from ._json import loads as json_loads, dumps as json_dumps
 from .config import AxoDenConfig
-from .exceptions import AxoDenError, AuthenticationError, MethodologyNotFoundError
-from .models import (
-    AgentProfile, 
-    MethodologyRequest,
-    MethodologyRecommendation,
-    ProjectContext
+from .exceptions import AuthenticationError, MethodologyNotFoundError
+from .models import MethodologyRecommendation
+
+__all__ = ["AxoDenClient", "AsyncAxoDenClient"]
+
+# Host and user identity, looked up once per process
+try:
+    _HOSTNAME = os.uname().nodename
+except AttributeError:  # Windows
+    import socket
+    _HOSTNAME = socket.gethostname()
+_USERNAME = os.environ.get("USER") or os.environ.get("USERNAME")
+
+# Compressed responses are decoded transparently; brotli is only advertised
+# when a decoder for it is installed
+if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+else:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Number of recommendations kept in each client's in-process cache
+_RECOMMENDATION_CACHE_SIZE = 256
+
+# Responses are parsed incrementally from the socket when ijson is installed,
+# instead of buffering the whole body first - unless they are known to be
+# smaller than this
+_STREAM_THRESHOLD = 32 * 1024
+
+# Files that _detect_project_context looks for
+_LANGUAGE_MARKERS = (
+    # (language marker files, language, ((framework marker file, framework), ...))
+    (("package.json",), "javascript", (("next.config.js", "nextjs"), ("vue.config.js", "vue"))),
+    (("requirements.txt", "setup.py"), "python", (("manage.py", "django"), ("app.py", "flask"), ("application.py", "flask"))),
+    (("Cargo.toml",), "rust", ()),
+    (("go.mod",), "go", ()),
 )
+_PROJECT_MARKERS = frozenset(
+    name
+    for markers, _, frameworks in _LANGUAGE_MARKERS
+    for name in markers + tuple(marker for marker, _ in frameworks)
+)
+
+# Static parts of the agent registration body
+_DEFAULT_COGNITIVE_PROFILE = {
+    "processing": 0.7,  # Default profile for developers
+    "focus": 0.8,
+    "flexibility": 0.6,
+    "abstraction": 0.7
+}
+_DEFAULT_CAPABILITIES = (
+    "claude_code_integration",
+    "methodology_application",
+    "development",
+    "debugging",
+    "analysis"
+)
+
+
+def _read_json(response) -> Any:
+    """Decode a JSON response body, streaming large requests bodies through ijson"""
+    raw = getattr(response, "raw", None)
+    # Content-Length is the size on the wire, so it only bounds the decoded
+    # body when the response isn't compressed; chunked responses have none
+    length = response.headers.get("Content-Length")
+    small = (
+        length is not None
+        and length.isdigit()
+        and int(length) <= _STREAM_THRESHOLD
+        and response.headers.get("Content-Encoding", "identity") == "identity"
+    )
+    if raw is not None and not small:
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+        
+        if ijson is not None:
+            raw.decode_content = True
+            try:
+                return next(ijson.items(raw, "", use_float=True))
+            finally:
+                response.close()
+    
+    return json_loads(response.content)
+
+
+class _HTTP2Session:
+    """Minimal requests.Session look-alike on top of an HTTP/2 httpx.Client"""
+    
+    def __init__(self, client):
+        self._client = client
+        self.headers = client.headers
+    
+    def get(self, url: str, **kwargs):
+        return self._client.get(url, **kwargs)
+    
+    def post(self, url: str, data: Optional[bytes] = None, stream: bool = False, **kwargs):
+        # httpx takes raw request bodies as `content`; `stream` is a requests
+        # option, httpx responses here are always read in full
+        return self._client.post(url, content=data, **kwargs)
+    
+    def close(self):
+        self._client.close()
+
+
+def _create_http2_session(headers: Dict[str, str], config: AxoDenConfig) -> Optional[_HTTP2Session]:
+    """Create an HTTP/2 session, or None if httpx with HTTP/2 support isn't installed"""
+    try:
+        import httpx
+        import h2  # noqa: F401 - required by httpx for HTTP/2
+    except ImportError:
+        return None
+    
+    limits = httpx.Limits(
+        max_keepalive_connections=config.pool_connections,
+        max_connections=config.pool_maxsize
+    )
+    transport = httpx.HTTPTransport(http2=True, limits=limits, retries=3)
+    # Match requests: no client-side timeout and redirects are followed
+    return _HTTP2Session(httpx.Client(
+        headers=headers,
+        transport=transport,
+        timeout=None,
+        follow_redirects=True
+    ))
+
+
+def _create_requests_session(headers: Dict[str, str], config: AxoDenConfig):
+    """Create a pooled, retrying HTTP/1.1 requests session"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers.update(headers)
+    session.headers["Connection"] = "keep-alive"
+    
+    # Keep connections to the API host pooled and retry transient failures
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            # Hand the last error response back so callers can report its status and body
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class AxoDenClient:
     """Main client for interacting with AxoDen's AI guidance system"""
     
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, http2: bool = False):
         """Initialize AxoDen client
         
         Args:
             api_key: AxoDen API key (optional, can use env var AXODEN_API_KEY)
             base_url: API base URL (optional, defaults to https://api.axoden.com)
+            http2: Use HTTP/2 via httpx when installed (falls back to requests otherwise).
+                Only connection errors are retried on this path, not 429/5xx responses
         """
         self.config = AxoDenConfig()
         self.api_key = api_key or self.config.api_key
@@ -39,61 +189,93 @@ class AxoDenClient:
                 "No API key found. Set AXODEN_API_KEY environment variable or pass api_key parameter"
             )
         
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._http2 = http2
+        self.session = self._create_session()
+        
+        # Endpoint URLs, built once
+        self._url_register = f"{self.base_url}/api/v1/agents/register"
+        self._url_assign = f"{self.base_url}/api/v1/assignments/request?agent_id={self.agent_id}"
+        self._url_assign_batch = f"{self.base_url}/api/v1/assignments/request_batch?agent_id={self.agent_id}"
+        
+        # Agent registration is deferred until the first API call that needs it
+        self._registered = False
+        
+        # Recent recommendations keyed by (problem, context, format)
+        self._rec_cache: "OrderedDict[str, MethodologyRecommendation]" = OrderedDict()
+        
+        # Last detected project context, keyed by (cwd, directory mtime)
+        self._context_cache: Optional[Tuple[Tuple[str, int], Dict[str, Any]]] = None
+    
+    def _create_session(self):
+        """Create the HTTP session, preferring HTTP/2 when requested and available"""
+        headers = self._default_headers()
+        session = None
+        if self._http2:
+            session = _create_http2_session(headers, self.config)
+        if session is None:
+            session = _create_requests_session(headers, self.config)
+        return session
+    
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every API request"""
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
-            "User-Agent": f"AxoDen-Client/{self.config.version}"
-        })
-        
-        # Auto-register agent on initialization
-        self._ensure_agent_registered()
+            "User-Agent": f"AxoDen-Client/{self.config.version}",
+            "Accept-Encoding": _ACCEPT_ENCODING
+        }
     
     def _generate_agent_id(self) -> str:
         """Generate unique agent ID for this client"""
-        hostname = os.uname().nodename
-        username = os.environ.get("USER", "unknown")
-        return f"claude-code-{username}-{hostname}-{uuid.uuid4().hex[:8]}"
+        return f"claude-code-{_USERNAME or 'unknown'}-{_HOSTNAME}-{uuid.uuid4().hex[:8]}"
     
     def _ensure_agent_registered(self):
         """Ensure this client's agent is registered with AxoDen"""
+        if not self._needs_registration():
+            return
+        
         try:
-            # Check if agent exists
-            response = self.session.get(f"{self.base_url}/api/v1/agents/{self.agent_id}")
-            if response.status_code == 404:
-                # Register new agent
-                self._register_agent()
+            self._register_agent()
         except Exception as e:
             # Non-critical - agent registration can fail without blocking client
             print(f"Warning: Could not verify agent registration: {e}")
     
-    def _register_agent(self):
-        """Register this client as an agent"""
-        agent_data = {
-            "agent_id": self.agent_id,
-            "name": f"Claude Code Client ({os.environ.get('USER', 'User')})",
-            "cognitive_profile": {
-                "processing": 0.7,  # Default profile for developers
-                "focus": 0.8,
-                "flexibility": 0.6,
-                "abstraction": 0.7
-            },
-            "capabilities": [
-                "claude_code_integration",
-                "methodology_application",
-                "development",
-                "debugging",
-                "analysis"
-            ]
-        }
-        
+    def _register_agent(self) -> bool:
+        """Register this client as an agent, returning whether it succeeded"""
         response = self.session.post(
-            f"{self.base_url}/api/v1/agents/register",
-            json=agent_data
+            self._url_register,
+            data=json_dumps(self._agent_data())
         )
-        
-        if response.status_code != 200:
+        return self._handle_registration_response(response)
+    
+    def _needs_registration(self) -> bool:
+        """Whether registration still has to be attempted by this client"""
+        if self._registered:
+            return False
+        # Only checked once per client, whether or not it succeeds
+        self._registered = True
+        return not self.config.is_agent_registered(self.base_url, self.agent_id)
+    
+    def _agent_data(self) -> Dict[str, Any]:
+        """Registration body for this client's agent"""
+        return {
+            "agent_id": self.agent_id,
+            # Registration is idempotent, so no separate existence check is needed
+            "idempotent": True,
+            "name": f"Claude Code Client ({_USERNAME or 'User'})",
+            "cognitive_profile": _DEFAULT_COGNITIVE_PROFILE,
+            "capabilities": _DEFAULT_CAPABILITIES
+        }
+    
+    def _handle_registration_response(self, response) -> bool:
+        """Record a successful registration, returning whether it succeeded"""
+        # 409 means the agent already exists, which is just as good
+        if response.status_code not in (200, 201, 409):
             print(f"Warning: Agent registration failed: {response.text}")
+            return False
+        
+        self.config.mark_agent_registered(self.base_url, self.agent_id)
+        return True
     
     def recommend(self, 
                   problem: str,
@@ -109,11 +291,160 @@ class AxoDenClient:
         Returns:
             MethodologyRecommendation object
         """
+        self._ensure_agent_registered()
+        
+        # Make request to assignment endpoint
+        try:
+            cache_key, request_data, cached = self._prepare_recommend(problem, context, format)
+            if cached is not None:
+                return cached
+            
+            response = self.session.post(
+                self._url_assign,
+                data=json_dumps(request_data),
+                stream=True
+            )
+            return self._handle_recommend_response(response, cache_key, format)
+        except Exception as e:
+            raise MethodologyNotFoundError(
+                f"Could not connect to AxoDen API or get methodology recommendation for: {problem}. "
+                f"Error: {e}. Please check if the deployed system has the complete knowledge base."
+            )
+    
+    def recommend_batch(self,
+                        problems: List[Tuple[str, Optional[Dict[str, Any]]]],
+                        format: str = "claude") -> List[MethodologyRecommendation]:
+        """Get methodology recommendations for several problems in one request
+        
+        Args:
+            problems: List of (problem, context) pairs; context may be None
+            format: Output format ('claude' for Claude Code optimized, 'json' for raw)
+            
+        Returns:
+            MethodologyRecommendation objects in the same order as `problems`
+        """
+        if not problems:
+            return []
+        if len(problems) == 1:
+            # Nothing to amortize - use the regular endpoint
+            problem, context = problems[0]
+            return [self.recommend(problem, context, format)]
+        
+        self._ensure_agent_registered()
+        
+        try:
+            request_data = self._prepare_batch(problems, format)
+            response = self.session.post(
+                self._url_assign_batch,
+                data=json_dumps(request_data),
+                stream=True
+            )
+            return self._handle_batch_response(response, len(problems), format)
+        except MethodologyNotFoundError:
+            raise
+        except Exception as e:
+            raise MethodologyNotFoundError(
+                f"Could not connect to AxoDen API or get methodology recommendations for "
+                f"{len(problems)} problems. Error: {e}"
+            )
+    
+    def _prepare_recommend(self, problem: str, context: Optional[Dict[str, Any]],
+                           format: str) -> Tuple[str, Dict[str, Any], Optional[MethodologyRecommendation]]:
+        """Build the request for one problem and look it up in the cache
+        
+        Returns:
+            (cache key, request body, cached recommendation or None)
+        """
         # Detect project context if not provided
         if not context:
             context = self._detect_project_context()
         
-        request_data = {
+        cache_key = self._cache_key(problem, context, format)
+        cached = self._rec_cache.get(cache_key)
+        if cached is not None:
+            self._rec_cache.move_to_end(cache_key)
+            cached = copy.deepcopy(cached)
+        
+        return cache_key, self._build_request_data(problem, context, format), cached
+    
+    def _handle_recommend_response(self, response, cache_key: str, format: str) -> MethodologyRecommendation:
+        """Turn an assignment response into a (cached) recommendation"""
+        if response.status_code != 200:
+            # API returned error status
+            raise MethodologyNotFoundError(
+                f"API request failed with status {response.status_code}: {response.text}"
+            )
+        
+        response_data = _read_json(response)
+        # Check if we got actual methodology data or just generic response
+        if "methodology" not in response_data and "steps" not in response_data:
+            # API returned success but no methodology data
+            raise MethodologyNotFoundError(
+                f"API returned success but no methodology recommendations available. "
+                f"The deployed system may be missing the knowledge base. "
+                f"Response: {response_data}"
+            )
+        
+        recommendation = self._parse_recommendation(response_data, format)
+        self._cache_recommendation(cache_key, recommendation)
+        return recommendation
+    
+    def _prepare_batch(self, problems: List[Tuple[str, Optional[Dict[str, Any]]]], format: str) -> Dict[str, Any]:
+        """Build the batch request body"""
+        # Detect project context once for every problem that didn't provide one
+        detected_context = None
+        requests_data = []
+        for problem, context in problems:
+            if not context:
+                if detected_context is None:
+                    detected_context = self._detect_project_context()
+                context = detected_context
+            requests_data.append(self._build_request_data(problem, context, format))
+        return {"requests": requests_data}
+    
+    def _handle_batch_response(self, response, count: int, format: str) -> List[MethodologyRecommendation]:
+        """Turn a batch assignment response into recommendations, in request order"""
+        if response.status_code != 200:
+            raise MethodologyNotFoundError(
+                f"API request failed with status {response.status_code}: {response.text}"
+            )
+        
+        results = _read_json(response)
+        if not isinstance(results, list) or len(results) != count:
+            raise MethodologyNotFoundError(
+                f"API returned {len(results) if isinstance(results, list) else 'no'} results "
+                f"for {count} problems"
+            )
+        
+        recommendations = []
+        for response_data in results:
+            if "methodology" not in response_data and "steps" not in response_data:
+                raise MethodologyNotFoundError(
+                    f"API returned success but no methodology recommendations available. "
+                    f"Response: {response_data}"
+                )
+            recommendations.append(self._parse_recommendation(response_data, format))
+        return recommendations
+    
+    def clear_cache(self):
+        """Forget all cached recommendations"""
+        self._rec_cache.clear()
+    
+    def _cache_key(self, problem: str, context: Dict[str, Any], format: str) -> str:
+        """Stable cache key for a recommendation request"""
+        payload = json_dumps({"p": problem, "c": context, "f": format}, sort_keys=True)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _cache_recommendation(self, cache_key: str, recommendation: MethodologyRecommendation):
+        """Store a copy of a recommendation, evicting the least recently used entry"""
+        self._rec_cache[cache_key] = copy.deepcopy(recommendation)
+        self._rec_cache.move_to_end(cache_key)
+        if len(self._rec_cache) > _RECOMMENDATION_CACHE_SIZE:
+            self._rec_cache.popitem(last=False)
+    
+    def _build_request_data(self, problem: str, context: Dict[str, Any], format: str) -> Dict[str, Any]:
+        """Build the assignment request body for one problem"""
+        return {
             "problem_description": problem,
             "project_context": context,
             "constraints": {
@@ -121,68 +452,41 @@ class AxoDenClient:
                 "agent_type": "claude_code"
             }
         }
-        
-        # Make request to assignment endpoint
-        try:
-            response = self.session.post(
-                f"{self.base_url}/api/v1/assignments/request?agent_id={self.agent_id}",
-                json=request_data
-            )
-            
-            if response.status_code == 200:
-                response_data = response.json()
-                # Check if we got actual methodology data or just generic response
-                if "methodology" in response_data or "steps" in response_data:
-                    return self._parse_recommendation(response_data, format)
-                else:
-                    # API returned success but no methodology data
-                    raise MethodologyNotFoundError(
-                        f"API returned success but no methodology recommendations available. "
-                        f"The deployed system may be missing the knowledge base. "
-                        f"Response: {response_data}"
-                    )
-            else:
-                # API returned error status
-                raise MethodologyNotFoundError(
-                    f"API request failed with status {response.status_code}: {response.text}"
-                )
-                
-        except Exception as e:
-            raise MethodologyNotFoundError(
-                f"Could not connect to AxoDen API or get methodology recommendation for: {problem}. "
-                f"Error: {e}. Please check if the deployed system has the complete knowledge base."
-            )
     
     def _detect_project_context(self) -> Dict[str, Any]:
         """Auto-detect project context from current directory"""
+        # The directory mtime changes whenever entries are added or removed
+        cache_key = (os.getcwd(), os.stat(".").st_mtime_ns)
+        if self._context_cache is not None and self._context_cache[0] == cache_key:
+            return dict(self._context_cache[1])
+        
         context = {
             "language": "unknown",
             "framework": "unknown",
             "project_type": "general"
         }
         
-        # Simple detection based on files in current directory
-        files = os.listdir(".")
-        
-        # Language detection
-        if "package.json" in files:
-            context["language"] = "javascript"
-            if "next.config.js" in files:
-                context["framework"] = "nextjs"
-            elif "vue.config.js" in files:
-                context["framework"] = "vue"
-        elif "requirements.txt" in files or "setup.py" in files:
-            context["language"] = "python"
-            if "manage.py" in files:
-                context["framework"] = "django"
-            elif "app.py" in files or "application.py" in files:
-                context["framework"] = "flask"
-        elif "Cargo.toml" in files:
-            context["language"] = "rust"
-        elif "go.mod" in files:
-            context["language"] = "go"
-        
-        return context
+        # Simple detection based on marker files in current directory
+        files = set()
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if entry.name in _PROJECT_MARKERS:
+                    files.add(entry.name)
+                    if len(files) == len(_PROJECT_MARKERS):
+                        break
+        
+        # Language detection - first matching language wins, then its first matching framework
+        for markers, language, frameworks in _LANGUAGE_MARKERS:
+            if not files.isdisjoint(markers):
+                context["language"] = language
+                for marker, framework in frameworks:
+                    if marker in files:
+                        context["framework"] = framework
+                        break
+                break
+        
+        self._context_cache = (cache_key, context)
+        return dict(context)
     
     def _parse_recommendation(self, response_data: Dict, format: str) -> MethodologyRecommendation:
         """Parse API response into MethodologyRecommendation"""
@@ -196,9 +500,6 @@ class AxoDenClient:
             alternatives=response_data.get("alternatives", [])
         )
         
-        if format == "claude":
-            recommendation.format_for_claude_code()
-        
         return recommendation
     
     # Fallback method removed - client now requires working API with real methodology database
@@ -226,4 +527,148 @@ class AxoDenClient:
                 "Documentation-Driven Development"
             ],
             "confidence": 0.8
-        }
\ No newline at end of file
+        }
+
+class AsyncAxoDenClient(AxoDenClient):
+    """asyncio variant of AxoDenClient for issuing many recommendations concurrently
+    
+    Requires httpx (`pip install axoden-client[http2]`). The synchronous methods
+    inherited from AxoDenClient keep working alongside the async ones; their
+    session is only created the first time one of them is used.
+    """
+    
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, http2: bool = True):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("AsyncAxoDenClient requires httpx: pip install 'axoden-client[http2]'")
+        
+        super().__init__(api_key, base_url, http2=http2)
+        
+        try:
+            import h2  # noqa: F401 - required by httpx for HTTP/2
+        except ImportError:
+            http2 = False
+        
+        limits = httpx.Limits(
+            max_keepalive_connections=self.config.pool_connections,
+            max_connections=self.config.pool_maxsize
+        )
+        self.async_session = httpx.AsyncClient(
+            headers=self._default_headers(),
+            transport=httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=3),
+            timeout=None,
+            follow_redirects=True
+        )
+    
+    def _create_session(self):
+        # Deferred to the session property - most async users never need it
+        return None
+    
+    @property
+    def session(self):
+        """Synchronous session, created on first use"""
+        if self._sync_session is None:
+            self._sync_session = super()._create_session()
+        return self._sync_session
+    
+    @session.setter
+    def session(self, value):
+        self._sync_session = value
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the underlying HTTP connections"""
+        await self.async_session.aclose()
+        if self._sync_session is not None:
+            self._sync_session.close()
+            self._sync_session = None
+    
+    async def _aensure_agent_registered(self):
+        """Async counterpart of _ensure_agent_registered"""
+        if not self._needs_registration():
+            return
+        
+        try:
+            await self._aregister_agent()
+        except Exception as e:
+            # Non-critical - agent registration can fail without blocking client
+            print(f"Warning: Could not verify agent registration: {e}")
+    
+    async def _aregister_agent(self) -> bool:
+        """Async counterpart of _register_agent"""
+        response = await self.async_session.post(
+            self._url_register,
+            content=json_dumps(self._agent_data())
+        )
+        return self._handle_registration_response(response)
+    
+    async def arecommend(self,
+                         problem: str,
+                         context: Optional[Dict[str, Any]] = None,
+                         format: str = "claude") -> MethodologyRecommendation:
+        """Async counterpart of recommend()"""
+        await self._aensure_agent_registered()
+        
+        try:
+            cache_key, request_data, cached = self._prepare_recommend(problem, context, format)
+            if cached is not None:
+                return cached
+            
+            response = await self.async_session.post(
+                self._url_assign,
+                content=json_dumps(request_data)
+            )
+            return self._handle_recommend_response(response, cache_key, format)
+        except Exception as e:
+            raise MethodologyNotFoundError(
+                f"Could not connect to AxoDen API or get methodology recommendation for: {problem}. "
+                f"Error: {e}. Please check if the deployed system has the complete knowledge base."
+            )
+    
+    async def arecommend_batch(self,
+                               problems: List[Tuple[str, Optional[Dict[str, Any]]]],
+                               format: str = "claude") -> List[MethodologyRecommendation]:
+        """Async counterpart of recommend_batch()"""
+        if not problems:
+            return []
+        if len(problems) == 1:
+            # Nothing to amortize - use the regular endpoint
+            problem, context = problems[0]
+            return [await self.arecommend(problem, context, format)]
+        
+        await self._aensure_agent_registered()
+        
+        try:
+            request_data = self._prepare_batch(problems, format)
+            response = await self.async_session.post(
+                self._url_assign_batch,
+                content=json_dumps(request_data)
+            )
+            return self._handle_batch_response(response, len(problems), format)
+        except MethodologyNotFoundError:
+            raise
+        except Exception as e:
+            raise MethodologyNotFoundError(
+                f"Could not connect to AxoDen API or get methodology recommendations for "
+                f"{len(problems)} problems. Error: {e}"
+            )
+    
+    async def arecommend_many(self,
+                              problems: List[str],
+                              context: Optional[Dict[str, Any]] = None,
+                              format: str = "claude") -> List[MethodologyRecommendation]:
+        """Request recommendations for several problems concurrently, one request each
+        
+        Results are returned in the same order as `problems`.
+        """
+        import asyncio
+        
+        # Register up front so concurrent requests don't each try to
+        await self._aensure_agent_registered()
+        return await asyncio.gather(*(self.arecommend(p, context, format) for p in problems))
@@ -3,10 +3,35 @@ AxoDen Client - Configuration management
 """
 
 import os
-import json
-import keyring
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from ._json import loads as json_loads, dumps as json_dumps
+
+
+# Marks an API key that hasn't been looked up yet
+_UNSET = object()
+
+
+def _get_stored_api_key() -> Optional[str]:
+    """Look up the API key in the system keyring"""
+    # Waits for the backend, which may be showing an unlock prompt - giving up
+    # early would make a stored key look like a missing one
+    try:
+        import keyring
+        return keyring.get_password("axoden", "api_key")
+    except Exception:
+        return None
+
+
+def _registered_agents(config_data: Dict[str, Any]) -> Dict[str, List[str]]:
+    """The {base_url: [agent_id, ...]} registration record from config file data"""
+    registered = config_data.get("registered_agents")
+    # Anything else (including the older flat list, which didn't say which
+    # server an agent was registered with) just means registering again
+    if not isinstance(registered, dict):
+        return {}
+    return {url: ids for url, ids in registered.items() if isinstance(ids, list)}
 
 
 class AxoDenConfig:
@@ -29,41 +54,52 @@ class AxoDenConfig:
         self.base_url = "https://api.axoden.com"
         self.agent_id = None
         self.default_format = "claude"
+        self.pool_connections = 4
+        self.pool_maxsize = 32
+        # Registered agent IDs per API base URL
+        self.registered_agents = {}
         
-        # Load from config file if exists
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                    self.base_url = config_data.get("base_url", self.base_url)
-                    self.agent_id = config_data.get("agent_id", self.agent_id)
-                    self.default_format = config_data.get("default_format", self.default_format)
-            except Exception:
-                pass
+        config_data = self._read_config_file()
+        self.base_url = config_data.get("base_url", self.base_url)
+        self.agent_id = config_data.get("agent_id", self.agent_id)
+        self.default_format = config_data.get("default_format", self.default_format)
+        self.pool_connections = config_data.get("pool_connections", self.pool_connections)
+        self.pool_maxsize = config_data.get("pool_maxsize", self.pool_maxsize)
+        self.registered_agents = _registered_agents(config_data)
         
         # Override with environment variables
         self.base_url = os.environ.get("AXODEN_API_URL", self.base_url)
         self.agent_id = os.environ.get("AXODEN_AGENT_ID", self.agent_id)
         
-        # API key from environment or secure storage
-        self._api_key = os.environ.get("AXODEN_API_KEY")
+        # API key from environment or secure storage, looked up on first access
+        self.reload_api_key()
+    
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Read the config file - a missing or unreadable file just means defaults"""
+        try:
+            config_data = json_loads(self.config_file.read_bytes())
+        except Exception:
+            return {}
+        return config_data if isinstance(config_data, dict) else {}
     
     @property
     def api_key(self) -> Optional[str]:
         """Get API key from environment or secure storage"""
-        if self._api_key:
-            return self._api_key
-        
-        # Try to get from keyring
-        try:
-            return keyring.get_password("axoden", "api_key")
-        except Exception:
-            return None
+        if self._api_key is _UNSET:
+            self._api_key = os.environ.get("AXODEN_API_KEY") or _get_stored_api_key()
+        return self._api_key
+    
+    def reload_api_key(self):
+        """Re-read the API key from the environment or the keyring on next access"""
+        self._api_key = _UNSET
     
     def save_api_key(self, api_key: str):
         """Save API key securely"""
         try:
+            import keyring
             keyring.set_password("axoden", "api_key", api_key)
+            if not os.environ.get("AXODEN_API_KEY"):
+                self._api_key = api_key
         except Exception:
             # Fallback to environment variable instruction
             print("Could not save API key securely.")
@@ -74,11 +110,44 @@ class AxoDenConfig:
         config_data = {
             "base_url": self.base_url,
             "agent_id": self.agent_id,
-            "default_format": self.default_format
+            "default_format": self.default_format,
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "registered_agents": self.registered_agents
         }
         
-        with open(self.config_file, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        self.config_file.write_bytes(json_dumps(config_data, pretty=True))
+    
+    def is_agent_registered(self, base_url: str, agent_id: str) -> bool:
+        """Whether an agent is known to be registered with the API at base_url"""
+        return agent_id in self.registered_agents.get(base_url.rstrip("/"), ())
+    
+    def mark_agent_registered(self, base_url: str, agent_id: str):
+        """Remember that an agent is registered so later runs can skip the check"""
+        base_url = base_url.rstrip("/")
+        registered = self.registered_agents.setdefault(base_url, [])
+        if agent_id not in registered:
+            registered.append(agent_id)
+        if not self.agent_id:
+            # Reuse the registered ID instead of generating a new agent every run
+            self.agent_id = agent_id
+        
+        # Only touch the registration keys on disk - save() would also persist
+        # values that came from environment overrides such as AXODEN_API_URL
+        config_data = self._read_config_file()
+        registered_agents = _registered_agents(config_data)
+        registered = registered_agents.setdefault(base_url, [])
+        if agent_id not in registered:
+            registered.append(agent_id)
+        config_data["registered_agents"] = registered_agents
+        if not config_data.get("agent_id") and agent_id != os.environ.get("AXODEN_AGENT_ID"):
+            config_data["agent_id"] = agent_id
+        
+        try:
+            self.config_file.write_bytes(json_dumps(config_data, pretty=True))
+        except OSError:
+            # Registration still succeeded; the check simply runs again next time
+            pass
     
     def reset(self):
         """Reset configuration to defaults"""
@@ -87,6 +156,7 @@ class AxoDenConfig:
         
         # Clear API key from keyring
         try:
+            import keyring
             keyring.delete_password("axoden", "api_key")
         except Exception:
             pass
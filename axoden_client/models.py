@@ -2,12 +2,21 @@
 AxoDen Client - Data models for API interactions
 """
 
+import sys
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+# Slotted instances are smaller and faster to read; dataclass(slots=True)
+# needs Python 3.10, so older interpreters keep a regular __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Closing line of every Claude Code formatted recommendation
+_FOOTER = "\n---\n💭 *To apply this methodology, explain to Claude Code what you want to implement using these principles.*"
+
+
+@dataclass(**_SLOTS)
 class CognitiveProfile:
     """Cognitive profile for methodology matching"""
     processing: float = 0.5
@@ -16,7 +25,7 @@ class CognitiveProfile:
     abstraction: float = 0.5
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentProfile:
     """Agent profile for AxoDen registration"""
     agent_id: str
@@ -25,7 +34,7 @@ class AgentProfile:
     capabilities: List[str] = field(default_factory=list)
     
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectContext:
     """Project context for methodology recommendations"""
     language: str = "unknown"
@@ -35,7 +44,7 @@ class ProjectContext:
     complexity: str = "medium"
     
 
-@dataclass
+@dataclass(**_SLOTS)
 class MethodologyRequest:
     """Request for methodology recommendation"""
     problem_description: str
@@ -43,7 +52,7 @@ class MethodologyRequest:
     constraints: Dict[str, Any] = field(default_factory=dict)
     
 
-@dataclass 
+@dataclass(**_SLOTS)
 class MethodologyRecommendation:
     """Methodology recommendation from AxoDen"""
     methodology_name: str
@@ -56,28 +65,26 @@ class MethodologyRecommendation:
     
     def format_for_claude_code(self) -> str:
         """Format recommendation for Claude Code consumption"""
-        output = f"🎯 **Recommended Methodology: {self.methodology_name}**\n\n"
-        output += f"📊 Confidence: {self.confidence:.0%}\n\n"
-        output += f"📝 Description: {self.description}\n\n"
+        parts = [
+            f"🎯 **Recommended Methodology: {self.methodology_name}**\n",
+            f"📊 Confidence: {self.confidence:.0%}\n",
+            f"📝 Description: {self.description}\n",
+        ]
         
         if self.steps:
-            output += "📋 **Implementation Steps:**\n"
-            for i, step in enumerate(self.steps, 1):
-                output += f"{i}. {step}\n"
-            output += "\n"
+            parts.append("📋 **Implementation Steps:**")
+            parts.extend(f"{i}. {step}" for i, step in enumerate(self.steps, 1))
+            parts.append("")
         
         if self.reasoning:
-            output += f"💡 **Reasoning:** {self.reasoning}\n\n"
+            parts.append(f"💡 **Reasoning:** {self.reasoning}\n")
             
         if self.alternatives:
-            output += "🔄 **Alternative Approaches:**\n"
-            for alt in self.alternatives:
-                output += f"- {alt}\n"
-        
-        output += "\n---\n"
-        output += "💭 *To apply this methodology, explain to Claude Code what you want to implement using these principles.*"
+            parts.append("🔄 **Alternative Approaches:**")
+            parts.extend(f"- {alt}" for alt in self.alternatives)
         
-        return output
+        parts.append(_FOOTER)
+        return "\n".join(parts)
     
     def to_json(self) -> Dict[str, Any]:
         """Convert to JSON format"""
@@ -33,12 +33,18 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.28.0",
+        "urllib3>=1.26.0",
         "click>=8.0.0",
         "rich>=13.0.0",
         "pydantic>=2.0.0",
         "python-dotenv>=1.0.0",
         "keyring>=23.0.0",  # For secure API key storage
     ],
+    extras_require={
+        "clipboard": ["pyperclip>=1.8.0"],
+        "perf": ["orjson>=3.8.0", "ijson>=3.1", "brotli>=1.0"],
+        "http2": ["httpx[http2]>=0.27.0"],
+    },
     entry_points={
         "console_scripts": [
             "axoden=axoden_client.cli:main",